@@ -6,6 +6,8 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.font_manager as fm
 import matplotlib.pyplot as plt
 from matplotlib.dates import date2num
+import task_store
+from task_view import TaskOrder, SORT_FIELDS
 
 # 主應用程式類別
 class TaskManagerApp:
@@ -16,9 +18,20 @@ class TaskManagerApp:
         """
         self.root = root
         self.root.title("Task and Time Management System")  # 設定視窗標題
-        self.root.geometry("600x400")  # 設定主視窗大小
+        self.root.geometry("600x440")  # 設定主視窗大小
         self.root.resizable(False, False)  # 禁止視窗縮放
-        self.tasks = []  # 儲存任務的列表
+        self.tasks = []  # 儲存任務的列表，與命令列介面共用資料檔
+        self.can_save = True  # 資料檔讀取失敗時不寫入，避免覆蓋原檔
+        self.tasks_mtime = None  # 上次讀寫資料檔時的修改時間，用來偵測外部修改
+        self.task_order = TaskOrder()  # 各排序欄位的有序清單
+        self.load_tasks_file()
+
+        # 清單顯示方式
+        self.sort_field = "deadline"  # 目前的排序欄位
+        self.sort_reverse = False  # 是否反向排序
+        self.group_by_category = tk.BooleanVar(value=False)  # 是否依類別分組
+        self.collapsed_categories = set()  # 已收合的類別
+        self.list_rows = []  # 清單每一列對應的任務；類別標題列則為類別名稱字串
 
         # 鍵盤視窗與目標輸入框
         self.keyboard_window = None
@@ -42,9 +55,23 @@ class TaskManagerApp:
         title_label = tk.Label(self.root, text="Task List", font=("Arial", 16, "bold"))
         title_label.grid(row=0, column=0, columnspan=2, pady=10)
 
-        # 任務清單框
+        # 排序與分組控制列
+        sort_frame = tk.Frame(self.root)
+        sort_frame.grid(row=1, column=0, padx=10, sticky="w")
+        tk.Label(sort_frame, text="Sort by:", font=("Arial", 9)).pack(side="left")
+        self.sort_buttons = {}
+        for field in SORT_FIELDS:
+            button = tk.Button(sort_frame, width=9, font=("Arial", 9),
+                               command=lambda f=field: self.set_sort_field(f))
+            button.pack(side="left", padx=1)
+            self.sort_buttons[field] = button
+        tk.Checkbutton(sort_frame, text="Group", font=("Arial", 9), variable=self.group_by_category,
+                       command=self.refresh_task_list).pack(side="left", padx=2)
+
+        # 任務清單框，雙擊類別標題可收合或展開
         self.task_listbox = tk.Listbox(self.root, height=15, width=50, font=("Arial", 10))
-        self.task_listbox.grid(row=1, column=0, rowspan=6, padx=10, pady=10)
+        self.task_listbox.grid(row=2, column=0, rowspan=6, padx=10, pady=5)
+        self.task_listbox.bind("<Double-Button-1>", self.toggle_category)
 
         # 功能按鈕
         button_texts = [
@@ -63,11 +90,108 @@ class TaskManagerApp:
 
     def refresh_task_list(self):
         """
-        更新任務清單的顯示內容。
+        依目前的排序欄位與分組設定，更新任務清單的顯示內容。
         """
+        for field, button in self.sort_buttons.items():
+            arrow = (" ▼" if self.sort_reverse else " ▲") if field == self.sort_field else ""
+            button.config(text=field.capitalize() + arrow)
+
         self.task_listbox.delete(0, tk.END)
-        for task in self.tasks:
-            self.task_listbox.insert(tk.END, f"{task['name']} - Due: {task['deadline']} (Category: {task['category']}, Status: {task['status']})")
+        self.list_rows = []
+        if self.group_by_category.get():
+            for category, tasks in self.task_order.grouped(self.sort_field, self.sort_reverse):
+                collapsed = category in self.collapsed_categories
+                marker = "▶" if collapsed else "▼"
+                self.task_listbox.insert(tk.END, f"{marker} {category} ({len(tasks)})")
+                self.list_rows.append(category)
+                if collapsed:
+                    continue
+                for task in tasks:
+                    self.task_listbox.insert(tk.END, "    " + task_store.format_task(task))
+                    self.list_rows.append(task)
+        else:
+            for task in self.task_order.ordered(self.sort_field, self.sort_reverse):
+                self.task_listbox.insert(tk.END, task_store.format_task(task))
+                self.list_rows.append(task)
+
+    def set_sort_field(self, field):
+        """
+        切換排序欄位；再次點選同一欄位則切換排序方向。
+        """
+        if field == self.sort_field:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_field = field
+            self.sort_reverse = False
+        self.refresh_task_list()
+
+    def toggle_category(self, event):
+        """
+        收合或展開雙擊的類別分組。
+        """
+        index = self.task_listbox.nearest(event.y)
+        if index < 0 or index >= len(self.list_rows):
+            return
+        category = self.list_rows[index]
+        if not isinstance(category, str):
+            return
+        if category in self.collapsed_categories:
+            self.collapsed_categories.remove(category)
+        else:
+            self.collapsed_categories.add(category)
+        self.refresh_task_list()
+
+    def get_selected_task(self):
+        """
+        取得清單中選定的任務；未選定或選到類別標題時回傳 None。
+        """
+        selected_index = self.task_listbox.curselection()
+        if not selected_index:
+            return None
+        row = self.list_rows[selected_index[0]]
+        return None if isinstance(row, str) else row
+
+    def load_tasks_file(self):
+        """
+        從資料檔讀取任務。
+        若檔案損毀，顯示錯誤訊息並以空列表啟動，且不寫入資料檔以免覆蓋原檔。
+        """
+        try:
+            self.tasks = task_store.load_tasks()
+            self.can_save = True
+        except (ValueError, OSError) as e:
+            self.tasks = []
+            self.can_save = False
+            messagebox.showerror("Load Error", f"{e}\nStarting with an empty task list; changes will not be saved.")
+        self.tasks_mtime = task_store.file_mtime()
+        self.task_order = TaskOrder(self.tasks)
+
+    def save_tasks(self):
+        """
+        將任務寫入資料檔。
+        寫入前比對檔案修改時間；若檔案在此期間被其他程式 (例如 task_cli) 修改，
+        詢問使用者要覆蓋檔案，或放棄這次修改並重新讀取檔案。
+        回傳 False 表示這次修改已被放棄。
+        """
+        if not self.can_save:
+            return True
+        if task_store.file_mtime() != self.tasks_mtime:
+            overwrite = messagebox.askyesno(
+                "File Changed",
+                "The task file was changed outside this window (for example by task_cli).\n"
+                "Yes: overwrite it with the tasks shown here.\n"
+                "No: discard this change and reload the file.")
+            if not overwrite:
+                self.load_tasks_file()
+                self.refresh_task_list()
+                return False
+        try:
+            task_store.save_tasks(self.tasks)
+        except OSError as e:
+            messagebox.showerror("Save Error", f"Cannot write task file: {e}")
+            return True
+        self.tasks_mtime = task_store.file_mtime()
+        return True
 
     def add_task(self):
         """
@@ -80,11 +204,10 @@ class TaskManagerApp:
         編輯已選定的任務。
         若未選定任務，顯示警告訊息。
         """
-        selected_index = self.task_listbox.curselection()
-        if not selected_index:
+        selected_task = self.get_selected_task()
+        if selected_task is None:
             messagebox.showwarning("No Selection", "Please select a task to edit.")
             return
-        selected_task = self.tasks[selected_index[0]]
         self.open_task_window("Edit Task", selected_task)
 
     def delete_task(self):
@@ -92,11 +215,15 @@ class TaskManagerApp:
         刪除已選定的任務。
         若未選定任務，顯示警告訊息。
         """
-        selected_index = self.task_listbox.curselection()
-        if not selected_index:
+        selected_task = self.get_selected_task()
+        if selected_task is None:
             messagebox.showwarning("No Selection", "Please select a task to delete.")
             return
-        del self.tasks[selected_index[0]]
+        self.task_order.remove(selected_task)
+        # 以物件身分比對，避免刪到內容相同的其他任務
+        self.tasks = [task for task in self.tasks if task is not selected_task]
+        if not self.save_tasks():
+            return
         self.refresh_task_list()
         messagebox.showinfo("Task Deleted", "Task has been deleted successfully.")
 
@@ -183,6 +310,12 @@ class TaskManagerApp:
         - task: 若為編輯模式，傳入要編輯的任務字典；新增模式則為 None。
         """
         def save_task():
+            # 編輯視窗非強制回應，編輯期間任務可能已被刪除或因重新讀取檔案而不存在
+            if task is not None and all(existing is not task for existing in self.tasks):
+                messagebox.showwarning("Task Not Found", "This task no longer exists; the changes were not saved.")
+                task_window.destroy()
+                return
+
             name = name_entry.get().strip()
             deadline = deadline_entry.get().strip()
             category = category_entry.get().strip() or "General"
@@ -192,7 +325,7 @@ class TaskManagerApp:
                 return
 
             try:
-                datetime.strptime(deadline, "%Y-%m-%d")
+                deadline = task_store.validate_deadline(deadline)  # 統一為補零格式
             except ValueError:
                 messagebox.showerror("Date Error", "Deadline must be in YYYY-MM-DD format.")
                 return
@@ -201,9 +334,13 @@ class TaskManagerApp:
                 task['name'] = name
                 task['deadline'] = deadline
                 task['category'] = category
+                self.task_order.update(task)
             else:
-                self.tasks.append({'name': name, 'deadline': deadline, 'category': category, 'status': 'Pending'})
+                new_task = task_store.make_task(name, deadline, category)
+                self.tasks.append(new_task)
+                self.task_order.add(new_task)
 
+            self.save_tasks()
             task_window.destroy()
             self.refresh_task_list()
 
@@ -0,0 +1,195 @@
+"""
+任務管理系統的命令列介面，供腳本與自動化使用。
+不載入 Tk、matplotlib 或 tkcalendar，與主程式共用 task_store 的任務資料。
+
+用法 (於 code 目錄下執行)：
+    python -m task_cli add "Report" 2024-06-01 --category Work
+    python -m task_cli list --json      (--json / --file 可放在子命令前或後)
+    python -m task_cli query --status Pending --before 2024-07-01
+    python -m task_cli edit 1 --status Done
+    python -m task_cli delete 1
+任務編號從 1 開始，與 list 輸出一致。
+"""
+import argparse
+import json
+import sys
+
+import task_store
+
+
+def build_parser():
+    """
+    建立命令列參數解析器。
+    """
+    # 共用選項同時加在主解析器與各子命令，預設值用 SUPPRESS 以免子命令覆蓋主解析器的設定
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--json", action="store_true", default=argparse.SUPPRESS, help="以 JSON 格式輸出")
+    common.add_argument("--file", default=argparse.SUPPRESS,
+                        help="任務資料檔案路徑 (預設為 TASKS_FILE 或 code/tasks.json)")
+
+    parser = argparse.ArgumentParser(prog="task_cli", description="Task and Time Management System (CLI)",
+                                     parents=[common])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    add_parser = subparsers.add_parser("add", help="新增任務", parents=[common])
+    add_parser.add_argument("name")
+    add_parser.add_argument("deadline", help="YYYY-MM-DD")
+    add_parser.add_argument("--category", default="General")
+    add_parser.add_argument("--status", default="Pending")
+
+    subparsers.add_parser("list", help="列出所有任務", parents=[common])
+
+    query_parser = subparsers.add_parser("query", help="依條件查詢任務", parents=[common])
+    query_parser.add_argument("--name", help="名稱包含的文字 (不分大小寫)")
+    query_parser.add_argument("--category")
+    query_parser.add_argument("--status")
+    query_parser.add_argument("--before", help="截止日期不晚於 YYYY-MM-DD")
+    query_parser.add_argument("--after", help="截止日期不早於 YYYY-MM-DD")
+
+    edit_parser = subparsers.add_parser("edit", help="編輯任務", parents=[common])
+    edit_parser.add_argument("id", type=int)
+    edit_parser.add_argument("--name")
+    edit_parser.add_argument("--deadline", help="YYYY-MM-DD")
+    edit_parser.add_argument("--category")
+    edit_parser.add_argument("--status")
+
+    delete_parser = subparsers.add_parser("delete", help="刪除任務", parents=[common])
+    delete_parser.add_argument("id", type=int)
+
+    return parser
+
+
+def check_date(parser, value):
+    """
+    驗證日期參數並回傳補零後的標準格式，格式錯誤時由 parser 結束程式。
+    """
+    try:
+        return task_store.validate_deadline(value)
+    except ValueError:
+        parser.error(f"Date must be in YYYY-MM-DD format: {value}")
+
+
+def check_required(parser, field, value):
+    """
+    檢查必填欄位不可為空字串。
+    """
+    if not value.strip():
+        parser.error(f"{field} must not be empty.")
+
+
+def save(parser, tasks, path):
+    """
+    寫入任務資料檔，無法寫入時由 parser 結束程式。
+    """
+    try:
+        task_store.save_tasks(tasks, path)
+    except OSError as e:
+        parser.error(f"Cannot write task file: {e}")
+
+
+def get_index(parser, tasks, task_id):
+    """
+    將從 1 開始的任務編號轉為列表索引。
+    """
+    if not 1 <= task_id <= len(tasks):
+        parser.error(f"No task with id {task_id}.")
+    return task_id - 1
+
+
+def match_task(task, args):
+    """
+    判斷任務是否符合查詢條件。
+    任務與查詢日期都已轉為補零的 YYYY-MM-DD，可直接以字串比較。
+    """
+    if args.name and args.name.lower() not in task['name'].lower():
+        return False
+    if args.category and task['category'] != args.category:
+        return False
+    if args.status and task['status'] != args.status:
+        return False
+    if args.before and task['deadline'] > args.before:
+        return False
+    if args.after and task['deadline'] < args.after:
+        return False
+    return True
+
+
+def print_tasks(entries, as_json):
+    """
+    輸出 (編號, 任務) 列表。
+    """
+    if as_json:
+        json.dump([dict(task, id=task_id) for task_id, task in entries], sys.stdout, ensure_ascii=False)
+        sys.stdout.write("\n")
+        return
+    for task_id, task in entries:
+        print(f"{task_id}. {task_store.format_task(task)}")
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    args.json = getattr(args, "json", False)
+    args.file = getattr(args, "file", None)
+    try:
+        tasks = task_store.load_tasks(args.file)
+    except ValueError as e:
+        parser.error(str(e))
+    except OSError as e:
+        parser.error(f"Cannot read task file: {e}")
+
+    if args.command == "add":
+        # 與主程式相同，文字欄位去除前後空白
+        name, category, status = args.name.strip(), args.category.strip(), args.status.strip()
+        check_required(parser, "name", name)
+        check_required(parser, "status", status)
+        deadline = check_date(parser, args.deadline.strip())
+        task = task_store.make_task(name, deadline, category, status)
+        tasks.append(task)
+        save(parser, tasks, args.file)
+        print_tasks([(len(tasks), task)], args.json)
+
+    elif args.command == "list":
+        print_tasks(list(enumerate(tasks, 1)), args.json)
+
+    elif args.command == "query":
+        if args.before:
+            args.before = check_date(parser, args.before)
+        if args.after:
+            args.after = check_date(parser, args.after)
+        print_tasks([(i, task) for i, task in enumerate(tasks, 1) if match_task(task, args)], args.json)
+
+    elif args.command == "edit":
+        index = get_index(parser, tasks, args.id)
+        for field in ("name", "deadline", "category", "status"):
+            value = getattr(args, field)
+            if value is not None:
+                setattr(args, field, value.strip())
+        for field in ("name", "deadline", "status"):
+            value = getattr(args, field)
+            if value is not None:
+                check_required(parser, field, value)
+        if args.deadline is not None:
+            args.deadline = check_date(parser, args.deadline)
+        if args.category is not None:
+            args.category = args.category or "General"  # 與 make_task 相同，空類別視為 General
+        task = tasks[index]
+        for field in ("name", "deadline", "category", "status"):
+            value = getattr(args, field)
+            if value is not None:
+                task[field] = value
+        save(parser, tasks, args.file)
+        print_tasks([(args.id, task)], args.json)
+
+    elif args.command == "delete":
+        index = get_index(parser, tasks, args.id)
+        task = tasks.pop(index)
+        save(parser, tasks, args.file)
+        print_tasks([(args.id, task)], args.json)
+
+    return 0
+
+
+# 主程式入口
+if __name__ == "__main__":
+    sys.exit(main())
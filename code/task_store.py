@@ -0,0 +1,87 @@
+import json
+import os
+from datetime import datetime
+
+# 任務資料檔案位置，可用環境變數 TASKS_FILE 覆寫
+DEFAULT_TASKS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tasks.json")
+DATE_FORMAT = "%Y-%m-%d"
+TASK_FIELDS = ("name", "deadline", "category", "status")
+
+
+def tasks_file_path():
+    """
+    取得任務資料檔案的路徑。
+    """
+    return os.environ.get("TASKS_FILE") or DEFAULT_TASKS_FILE
+
+
+def load_tasks(path=None):
+    """
+    從 JSON 檔案讀取任務列表。
+    - path: 檔案路徑；None 時使用預設路徑
+    若檔案不存在，回傳空列表；內容損毀或任務欄位不正確時拋出 ValueError。
+    截止日期會轉為補零的 YYYY-MM-DD，使日期可直接以字串比較與排序。
+    """
+    path = path or tasks_file_path()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            tasks = json.load(f)
+    except FileNotFoundError:
+        return []
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f"Task file {path} is not valid JSON: {e}") from e
+    if not isinstance(tasks, list):
+        raise ValueError(f"Task file {path} does not contain a list of tasks.")
+    for number, task in enumerate(tasks, 1):
+        if not isinstance(task, dict) or not all(isinstance(task.get(field), str) for field in TASK_FIELDS):
+            raise ValueError(f"Task {number} in {path} must have string fields: {', '.join(TASK_FIELDS)}.")
+        try:
+            task['deadline'] = validate_deadline(task['deadline'])
+        except ValueError:
+            raise ValueError(f"Task {number} in {path} has an invalid deadline: {task['deadline']}") from None
+    return tasks
+
+
+def file_mtime(path=None):
+    """
+    取得任務資料檔案的修改時間，用來偵測其他程式 (例如 task_cli) 是否改過檔案。
+    檔案不存在時回傳 None。
+    """
+    try:
+        return os.stat(path or tasks_file_path()).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def save_tasks(tasks, path=None):
+    """
+    將任務列表寫入 JSON 檔案。
+    先寫入暫存檔再取代，避免寫到一半時損毀資料。
+    """
+    path = path or tasks_file_path()
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(tasks, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def make_task(name, deadline, category="General", status="Pending"):
+    """
+    建立任務字典，欄位與主程式相同。
+    """
+    return {'name': name, 'deadline': deadline, 'category': category or "General", 'status': status}
+
+
+def validate_deadline(deadline):
+    """
+    檢查截止日期是否為 YYYY-MM-DD 格式，格式錯誤時拋出 ValueError。
+    回傳補零後的標準格式 (例如 2024-1-5 -> 2024-01-05)，儲存與比較時都應使用此值。
+    """
+    return datetime.strptime(deadline, DATE_FORMAT).date().isoformat()
+
+
+def format_task(task):
+    """
+    將任務轉為清單顯示用的字串。
+    """
+    return f"{task['name']} - Due: {task['deadline']} (Category: {task['category']}, Status: {task['status']})"
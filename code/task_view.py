@@ -0,0 +1,95 @@
+from bisect import bisect_left, bisect_right
+from itertools import count
+
+# 可排序的欄位
+SORT_FIELDS = ("deadline", "name", "category", "status")
+
+
+class TaskOrder:
+    """
+    依各排序欄位維護任務的有序清單。
+    每個欄位各保留一份已排序的鍵列表，新增或編輯任務時以二分搜尋插入，
+    切換排序欄位時直接取用對應的清單，不需重新排序全部任務。
+    注意：二分搜尋找位置為 O(log n)，但 list.insert / del 需要搬移其後的元素，
+    為 O(n) (每個欄位各有鍵與任務兩份列表)；此搬移是記憶體區塊複製，
+    在一般任務數量下遠快於每次 O(n log n) 的完整排序。
+    """
+
+    def __init__(self, tasks=()):
+        self._seq = count()  # 新增順序，用於排序值相同時維持穩定順序
+        self._keys = {field: [] for field in SORT_FIELDS}  # 各欄位已排序的鍵
+        self._tasks = {field: [] for field in SORT_FIELDS}  # 與鍵列表平行的任務
+        self._task_keys = {}  # id(任務) -> 各欄位目前使用的鍵
+        for task in tasks:
+            self.add(task)
+
+    def __len__(self):
+        return len(self._task_keys)
+
+    @staticmethod
+    def _sort_value(task, field):
+        """
+        取得任務在指定欄位的排序值，名稱不分大小寫。
+        截止日期依賴 task_store 統一存成補零的 YYYY-MM-DD，因此可直接以字串排序。
+        """
+        value = task[field]
+        return value.casefold() if field == "name" else value
+
+    def add(self, task, seq=None):
+        """
+        以二分搜尋將任務插入每個欄位的有序清單。
+        - seq: 保留原本的新增順序；None 時視為新任務
+        """
+        if seq is None:
+            seq = next(self._seq)
+        keys = {}
+        for field in SORT_FIELDS:
+            key = (self._sort_value(task, field), seq)
+            index = bisect_right(self._keys[field], key)
+            self._keys[field].insert(index, key)
+            self._tasks[field].insert(index, task)
+            keys[field] = key
+        self._task_keys[id(task)] = keys
+
+    def remove(self, task):
+        """
+        從所有有序清單移除任務，回傳其新增順序。
+        使用插入時記錄的鍵定位，因此任務內容已被修改也能正確移除。
+        """
+        keys = self._task_keys.pop(id(task))
+        for field, key in keys.items():
+            index = bisect_left(self._keys[field], key)
+            del self._keys[field][index]
+            del self._tasks[field][index]
+        return keys[SORT_FIELDS[0]][1]
+
+    def update(self, task):
+        """
+        任務內容修改後，重新放到正確位置，並保留原本的新增順序。
+        """
+        self.add(task, self.remove(task))
+
+    def ordered(self, field, reverse=False):
+        """
+        依指定欄位回傳排序後的任務列表。
+        反向排序時，排序值相同的任務仍維持新增順序。
+        """
+        tasks = self._tasks[field]
+        if not reverse:
+            return list(tasks)
+        # 鍵列表已排序，Timsort 只需 O(n) 即可完成穩定的反向排序
+        keys = self._keys[field]
+        indexes = sorted(range(len(tasks)), key=lambda i: keys[i][0], reverse=True)
+        return [tasks[i] for i in indexes]
+
+    def grouped(self, field, reverse=False):
+        """
+        依類別分組，回傳 (類別, 任務列表) 的列表；
+        類別依名稱排序 (依類別排序時則跟隨排序方向)，組內任務依指定欄位排序。
+        """
+        groups = {}
+        for task in self.ordered(field, reverse):
+            groups.setdefault(task['category'], []).append(task)
+        if field == "category":
+            return list(groups.items())
+        return sorted(groups.items(), key=lambda item: item[0])
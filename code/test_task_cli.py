@@ -0,0 +1,81 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import task_cli
+import task_store
+
+
+class TaskCliTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "tasks.json")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def run_cli(self, *argv):
+        """
+        執行命令列並回傳 JSON 輸出。
+        """
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            task_cli.main(["--file", self.path, "--json", *argv])
+        return json.loads(out.getvalue())
+
+    def assert_error(self, *argv, path=None):
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as cm:
+            task_cli.main(["--file", path or self.path, *argv])
+        self.assertEqual(cm.exception.code, 2)
+
+    def test_unpadded_dates(self):
+        self.run_cli("add", "A", "2024-1-5")
+        self.run_cli("add", "B", "2024-07-01")
+        self.run_cli("add", "C", "2024-10-01")
+        self.assertEqual(task_store.load_tasks(self.path)[0]['deadline'], "2024-01-05")
+        found = self.run_cli("query", "--before", "2024-8-1")
+        self.assertEqual([task['name'] for task in found], ["A", "B"])
+        found = self.run_cli("query", "--after", "2024-7-1")
+        self.assertEqual([task['name'] for task in found], ["B", "C"])
+
+    def test_json_flag_after_subcommand(self):
+        self.run_cli("add", "A", "2024-01-01")
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            task_cli.main(["list", "--file", self.path, "--json"])
+        self.assertEqual(json.loads(out.getvalue())[0]['id'], 1)
+
+    def test_add_strips_and_validates(self):
+        task = self.run_cli("add", "  Report ", "2024-06-01", "--category", " ")[0]
+        self.assertEqual((task['name'], task['category']), ("Report", "General"))
+        self.assert_error("add", " ", "2024-06-01")
+        self.assert_error("add", "A", "2024-06-01", "--status", "")
+        self.assert_error("add", "A", "2024-6-31")
+
+    def test_edit(self):
+        self.run_cli("add", "A", "2024-01-01", "--category", "Work")
+        task = self.run_cli("edit", "1", "--deadline", "2024-2-3", "--category", "", "--name", " B ")[0]
+        self.assertEqual((task['name'], task['deadline'], task['category']), ("B", "2024-02-03", "General"))
+        for field in ("--name", "--deadline", "--status"):
+            self.assert_error("edit", "1", field, "")
+        self.assert_error("edit", "2", "--status", "Done")
+
+    def test_delete(self):
+        self.run_cli("add", "A", "2024-01-01")
+        self.run_cli("add", "B", "2024-01-02")
+        self.assertEqual(self.run_cli("delete", "1")[0]['name'], "A")
+        self.assertEqual([task['name'] for task in self.run_cli("list")], ["B"])
+
+    def test_file_errors(self):
+        self.assert_error("add", "A", "2024-01-01", path=os.path.join(self.dir.name, "missing", "x.json"))
+        self.assert_error("list", path=self.dir.name)
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write('[{"name": "x"}]')
+        self.assert_error("list")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import json
+import os
+import tempfile
+import unittest
+
+import task_store
+
+
+class TaskStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "tasks.json")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def write(self, payload):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(payload if isinstance(payload, str) else json.dumps(payload))
+
+    def test_validate_deadline_pads_dates(self):
+        self.assertEqual(task_store.validate_deadline("2024-1-5"), "2024-01-05")
+        self.assertEqual(task_store.validate_deadline("2024-10-01"), "2024-10-01")
+        with self.assertRaises(ValueError):
+            task_store.validate_deadline("2024-13-01")
+
+    def test_round_trip(self):
+        tasks = [task_store.make_task("報告", "2024-06-01", "Work")]
+        task_store.save_tasks(tasks, self.path)
+        self.assertEqual(task_store.load_tasks(self.path), tasks)
+
+    def test_missing_file_is_empty(self):
+        self.assertEqual(task_store.load_tasks(self.path), [])
+        self.assertIsNone(task_store.file_mtime(self.path))
+
+    def test_load_pads_deadlines(self):
+        self.write([task_store.make_task("A", "2024-1-5")])
+        self.assertEqual(task_store.load_tasks(self.path)[0]['deadline'], "2024-01-05")
+
+    def test_invalid_payloads(self):
+        for payload in ("{bad", {"name": "x"}, [{"name": "x"}], ["x"],
+                        [{"name": "x", "deadline": 1, "category": "a", "status": "b"}],
+                        [task_store.make_task("x", "soon")]):
+            self.write(payload)
+            with self.assertRaises(ValueError, msg=payload):
+                task_store.load_tasks(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
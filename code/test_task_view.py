@@ -0,0 +1,84 @@
+import random
+import unittest
+
+from task_store import make_task, validate_deadline
+from task_view import TaskOrder, SORT_FIELDS
+
+
+def names(tasks):
+    return [task['name'] for task in tasks]
+
+
+class TaskOrderTest(unittest.TestCase):
+    def test_random_add_update_remove(self):
+        rng = random.Random(0)
+        tasks = [make_task(rng.choice("aBcD"), f"2024-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}",
+                           rng.choice(["Work", "Home", "General"]), rng.choice(["Pending", "Done"]))
+                 for _ in range(200)]
+        order = TaskOrder(tasks)
+        for task in rng.sample(tasks, 50):
+            task['name'] = rng.choice("xYz")
+            task['deadline'] = "2023-01-01"
+            task['category'] = rng.choice(["Work", "School"])
+            order.update(task)
+        removed = rng.sample(tasks, 50)
+        for task in removed:
+            order.remove(task)
+        # 以物件身分比對，內容相同的任務仍是不同任務
+        tasks = [task for task in tasks if all(task is not gone for gone in removed)]
+
+        self.assertEqual(len(order), 150)
+        for field in SORT_FIELDS:
+            ordered = order.ordered(field)
+            self.assertEqual(sorted(map(id, ordered)), sorted(map(id, tasks)))
+            # 與穩定的完整排序結果一致 (名稱不分大小寫)
+            expected = sorted(tasks, key=lambda task: task[field].casefold() if field == "name" else task[field])
+            self.assertEqual(list(map(id, ordered)), list(map(id, expected)), field)
+
+    def test_ties_keep_insertion_order(self):
+        first, second, third = (make_task(name, "2024-01-01") for name in "abc")
+        order = TaskOrder([first, second, third])
+        self.assertEqual(order.ordered("deadline"), [first, second, third])
+        # 編輯後保留原本的新增順序
+        order.update(first)
+        self.assertEqual(order.ordered("deadline"), [first, second, third])
+
+    def test_remove_after_task_changed(self):
+        task, other = make_task("a", "2024-01-01"), make_task("b", "2024-02-01")
+        order = TaskOrder([task, other])
+        task['name'] = "z"
+        task['deadline'] = "2025-01-01"
+        order.remove(task)
+        for field in SORT_FIELDS:
+            self.assertEqual(order.ordered(field), [other])
+
+    def test_unpadded_deadlines(self):
+        # 主程式與命令列都先經過 validate_deadline，再建立任務
+        order = TaskOrder([make_task(name, validate_deadline(deadline))
+                           for name, deadline in [("B", "2024-07-01"), ("A", "2024-1-5"), ("C", "2024-10-01")]])
+        self.assertEqual(names(order.ordered("deadline")), ["A", "B", "C"])
+
+    def test_name_ignores_case(self):
+        order = TaskOrder([make_task("B", "2024-01-01"), make_task("a", "2024-01-01"), make_task("c", "2024-01-01")])
+        self.assertEqual(names(order.ordered("name")), ["a", "B", "c"])
+
+    def test_reverse_keeps_ties_stable(self):
+        order = TaskOrder([make_task("late1", "2024-06-01"), make_task("early", "2024-01-01"),
+                           make_task("late2", "2024-06-01")])
+        self.assertEqual(names(order.ordered("deadline")), ["early", "late1", "late2"])
+        self.assertEqual(names(order.ordered("deadline", reverse=True)), ["late1", "late2", "early"])
+
+    def test_grouped(self):
+        order = TaskOrder([make_task("w1", "2024-06-01", "Work"), make_task("h", "2024-03-01", "Home"),
+                           make_task("w2", "2024-01-01", "Work")])
+        self.assertEqual([(category, names(tasks)) for category, tasks in order.grouped("deadline")],
+                         [("Home", ["h"]), ("Work", ["w2", "w1"])])
+        # 依類別反向排序時，分組順序也跟著反向
+        self.assertEqual([category for category, _ in order.grouped("category", reverse=True)],
+                         ["Work", "Home"])
+        self.assertEqual([(category, names(tasks)) for category, tasks in order.grouped("deadline", reverse=True)],
+                         [("Home", ["h"]), ("Work", ["w1", "w2"])])
+
+
+if __name__ == "__main__":
+    unittest.main()